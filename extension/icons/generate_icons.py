@@ -2,9 +2,14 @@
 """
 Generate colored icon sets for the extension status indicator.
 Creates icons for: green (unlocked), yellow (locked), red (error), gray (empty)
+
+Requires Pillow and NumPy. Pillow-SIMD can be used as a drop-in replacement
+for Pillow.
 """
 
-from PIL import Image, ImageDraw
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+import numpy as np
 import os
 
 # Sizes to generate
@@ -21,12 +26,8 @@ COLORS = {
 # Output directory
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
-def create_icon(size, color_hex, output_path):
-    """Create a simple circular icon with an inner design."""
-    # Create transparent background
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
+def render_icon(size, color_hex):
+    """Render a simple circular icon with an inner design."""
     # Parse color
     r = int(color_hex[1:3], 16)
     g = int(color_hex[3:5], 16)
@@ -35,14 +36,16 @@ def create_icon(size, color_hex, output_path):
     # Calculate dimensions
     padding = size // 8
     circle_radius = (size - 2 * padding) // 2
-    
-    # Draw main circle (filled)
     center = size // 2
-    draw.ellipse(
-        [center - circle_radius, center - circle_radius, 
-         center + circle_radius, center + circle_radius],
-        fill=(r, g, b, 255)
-    )
+    
+    # Build the pixels directly from coordinate masks rather than drawing
+    # each shape; yy is a column and xx a row, so masks broadcast to size x size
+    yy, xx = np.ogrid[:size, :size]
+    pixels = np.zeros((size, size, 4), dtype=np.uint8)  # Transparent background
+    
+    # Main circle (filled)
+    circle = (xx - center) ** 2 + (yy - center) ** 2 <= circle_radius * (circle_radius + 1)
+    pixels[circle] = (r, g, b, 255)
     
     # Add a simple "H" like shape (for Hyper/H) inside
     inner_size = circle_radius * 2
@@ -56,37 +59,57 @@ def create_icon(size, color_hex, output_path):
     left_x = center - inner_size // 3
     right_x = center + inner_size // 3
     
-    # Draw H-like shape
+    # H-like shape (bounds are inclusive, matching ImageDraw.rectangle)
+    def rect(x0, y0, x1, y1):
+        return (xx >= x0) & (xx <= x1) & (yy >= y0) & (yy <= y1)
+    
     # Left vertical
-    draw.rectangle(
-        [left_x - bar_width//2, center - bar_height//2,
-         left_x + bar_width//2, center + bar_height//2],
-        fill=(255, 255, 255, 255)
-    )
+    pixels[rect(left_x - bar_width//2, center - bar_height//2,
+                left_x + bar_width//2, center + bar_height//2)] = (255, 255, 255, 255)
     # Right vertical
-    draw.rectangle(
-        [right_x - bar_width//2, center - bar_height//2,
-         right_x + bar_width//2, center + bar_height//2],
-        fill=(255, 255, 255, 255)
-    )
+    pixels[rect(right_x - bar_width//2, center - bar_height//2,
+                right_x + bar_width//2, center + bar_height//2)] = (255, 255, 255, 255)
     # Horizontal bar
-    draw.rectangle(
-        [left_x - bar_width//2, center - stroke//2,
-         right_x + bar_width//2, center + stroke//2],
-        fill=(255, 255, 255, 255)
-    )
+    pixels[rect(left_x - bar_width//2, center - stroke//2,
+                right_x + bar_width//2, center + stroke//2)] = (255, 255, 255, 255)
+    
+    return Image.fromarray(pixels, 'RGBA')
+
+def save_icon(img, output_path):
+    """Save an icon and report it.
     
-    img.save(output_path)
+    Icons with only a few distinct colors are written as 2- or 4-bit
+    palette PNGs; anything else stays RGBA.
+    """
+    pixels = np.asarray(img).reshape(-1, 4)
+    palette, indices = np.unique(pixels, axis=0, return_inverse=True)
+    if len(palette) <= 16:
+        paletted = Image.frombytes('P', img.size, indices.astype(np.uint8).tobytes())
+        paletted.putpalette(palette[:, :3].tobytes())
+        paletted.save(
+            output_path,
+            transparency=palette[:, 3].tobytes(),
+            bits=2 if len(palette) <= 4 else 4,
+        )
+    else:
+        img.save(output_path)
     print(f'Created: {output_path}')
 
+def create_icon_set(color_name, color_hex):
+    """Create every size of the icon for one status color."""
+    # Rasterize each size directly so small icons stay crisp and paletted
+    for size in SIZES:
+        filename = f'icon-{color_name}-{size}.png'
+        output_path = os.path.join(SCRIPT_DIR, filename)
+        save_icon(render_icon(size, color_hex), output_path)
+
 def main():
-    for color_name, color_hex in COLORS.items():
-        for size in SIZES:
-            filename = f'icon-{color_name}-{size}.png'
-            output_path = os.path.join(SCRIPT_DIR, filename)
-            create_icon(size, color_hex, output_path)
+    # Pillow releases the GIL while encoding PNGs, so the colors can be
+    # generated in parallel threads
+    with ThreadPoolExecutor(max_workers=len(COLORS)) as executor:
+        list(executor.map(create_icon_set, COLORS.keys(), COLORS.values()))
     
     print('\nAll icons generated successfully!')
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
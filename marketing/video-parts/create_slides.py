@@ -1,8 +1,22 @@
 #!/usr/bin/env python3
-"""Create intro, chat demo, and outro slides for OnHyper agent video."""
+"""Create intro, chat demo, and outro slides for OnHyper agent video.
 
+Requires Pillow. Pillow-SIMD (pip install pillow-simd, after
+uninstalling Pillow) is a drop-in replacement that speeds up the drawing
+and compositing done per frame; no code changes are needed to use it.
+
+By default each section is written as a numbered PNG sequence. With --video
+the frames are piped straight into ffmpeg as raw RGB instead, producing
+intro.mp4, chat.mp4 and outro.mp4 without any intermediate PNGs.
+"""
+
+from functools import lru_cache
+from multiprocessing import Pool, cpu_count
 from PIL import Image, ImageDraw, ImageFont
+import argparse
 import os
+import shutil
+import subprocess
 
 # Dimensions
 WIDTH = 1920
@@ -15,11 +29,31 @@ DARK_BG = (26, 26, 46)   # #1a1a2e
 WHITE = (255, 255, 255)
 DARKER_BG = (15, 15, 30)
 
+# Frame sequences are written next to this script
+OUTPUT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Frame rate of every section
+FPS = 30
+
+# Fade in/out length for the intro and outro slides (1 second at 30fps)
+FADE_FRAMES = 30
+
+# zlib level for the PNG frame sequences (PIL defaults to 6). Level 1
+# encodes several times faster, but the frames are checked in, so this makes
+# the committed sequences noticeably larger (roughly 13 MB -> 21 MB). Raise it
+# before committing regenerated frames if repo size matters more than speed.
+PNG_COMPRESS_LEVEL = 1
+
+# Candidate font files, in order of preference
+FONT_PATHS = [
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/System/Library/Fonts/SFNSDisplay.ttf",
+]
+
+@lru_cache(maxsize=None)
 def get_font(size, bold=False):
     """Get a font, falling back to default if necessary."""
-    font_names = [
-        "/System/Library/Fonts/Helvetica.ttc",
-        "/System/Library/Fonts/SFNSDisplay.ttf",
+    font_names = FONT_PATHS + [
         "/Library/Fonts/Arial Bold.ttf" if bold else "/Library/Fonts/Arial.ttf",
     ]
     for font_name in font_names:
@@ -30,6 +64,12 @@ def get_font(size, bold=False):
                 pass
     return ImageFont.load_default()
 
+@lru_cache(maxsize=128)
+def get_text_width(text, size, bold=False):
+    """Measure the rendered width of text, for centering it."""
+    bbox = get_font(size, bold).getbbox(text)
+    return bbox[2] - bbox[0]
+
 def create_intro_slide():
     """Create the intro slide image."""
     img = Image.new('RGB', (WIDTH, HEIGHT), DARK_BG)
@@ -38,168 +78,250 @@ def create_intro_slide():
     # Title - OnHyper
     title_font = get_font(96, bold=True)
     title = "OnHyper"
-    bbox = draw.textbbox((0, 0), title, font=title_font)
-    title_w = bbox[2] - bbox[0]
+    title_w = get_text_width(title, 96, bold=True)
     draw.text(((WIDTH - title_w) // 2, HEIGHT // 2 - 120), title, font=title_font, fill=INDIGO)
     
     # Tagline
     tagline_font = get_font(42)
     tagline = "Where Agents Ship Code"
-    bbox = draw.textbbox((0, 0), tagline, font=tagline_font)
-    tagline_w = bbox[2] - bbox[0]
+    tagline_w = get_text_width(tagline, 42)
     draw.text(((WIDTH - tagline_w) // 2, HEIGHT // 2 + 20), tagline, font=tagline_font, fill=WHITE)
     
     # URL
     url_font = get_font(36)
     url = "onhyper.io"
-    bbox = draw.textbbox((0, 0), url, font=url_font)
-    url_w = bbox[2] - bbox[0]
+    url_w = get_text_width(url, 36)
     draw.text(((WIDTH - url_w) // 2, HEIGHT // 2 + 100), url, font=url_font, fill=CYAN)
     
     return img
 
-def create_chat_demo_frame(progress, phase):
-    """Create a chat demo frame at given progress (0.0 to 1.0)."""
-    img = Image.new('RGB', (WIDTH, HEIGHT), DARKER_BG)
-    draw = ImageDraw.Draw(img)
-    
-    # Chat window dimensions
-    chat_left = 160
-    chat_top = 80
-    chat_width = 1600
-    chat_height = 920
-    
-    # Draw chat window background
-    draw.rounded_rectangle(
-        [chat_left, chat_top, chat_left + chat_width, chat_top + chat_height],
-        radius=20,
-        fill=DARK_BG,
-        outline=(50, 50, 80),
-        width=2
-    )
-    
-    # Chat header
-    draw.rectangle([chat_left, chat_top, chat_left + chat_width, chat_top + 60], fill=(40, 40, 70))
-    header_font = get_font(28, bold=True)
-    draw.text((chat_left + 30, chat_top + 15), "OnHyper Agent Chat", font=header_font, fill=WHITE)
-    status_font = get_font(20)
-    draw.text((chat_left + chat_width - 180, chat_top + 20), "● Online", font=status_font, fill=CYAN)
-    
-    # User message bubble (always visible after phase 0)
-    user_msg = "Can you build me a todo app?"
-    user_font = get_font(26)
+# Chat window dimensions
+CHAT_LEFT = 160
+CHAT_TOP = 80
+CHAT_WIDTH = 1600
+CHAT_HEIGHT = 920
+
+# User message bubble
+USER_MSG = "Can you build me a todo app?"
+USER_BUBBLE_LEFT = CHAT_LEFT + CHAT_WIDTH - 650
+USER_BUBBLE_TOP = CHAT_TOP + 100
+USER_BUBBLE_WIDTH = 600
+USER_BUBBLE_HEIGHT = 60
+
+# Agent response area
+AGENT_BUBBLE_LEFT = CHAT_LEFT + 50
+AGENT_BUBBLE_TOP = CHAT_TOP + 220
+AGENT_BUBBLE_WIDTH = 800
+AGENT_BUBBLE_HEIGHT = 500
+AGENT_BUBBLE_FILL = (35, 35, 60)
+AGENT_LINE_HEIGHT = 36
+AGENT_TEXT_POS = (AGENT_BUBBLE_LEFT + 30, AGENT_BUBBLE_TOP + 30)
+
+AGENT_RESPONSE = """I've created your todo app! 🎉
+
+It's now live and ready to use at:
+onhyper.io/a/your-todo-app
+
+Features included:
+✓ Add, edit, delete todos
+✓ Mark as complete
+✓ Local storage persistence
+✓ Responsive design
+
+Your app is deployed and ready!"""
+
+# App preview section
+PREVIEW_LEFT = CHAT_LEFT + CHAT_WIDTH - 550
+PREVIEW_TOP = CHAT_TOP + 200
+PREVIEW_WIDTH = 500
+PREVIEW_HEIGHT = 600
+PREVIEW_FILL = (25, 25, 50)
+TODO_ROW_HEIGHT = 50
+TODO_POS = (PREVIEW_LEFT + 30, PREVIEW_TOP + 70)
+
+TODOS = [
+    ("☐ Build landing page", True),
+    ("☑ Create API endpoints", True),
+    ("☐ Add user auth", False),
+    ("☑ Deploy to production", True),
+]
+
+@lru_cache(maxsize=None)
+def get_agent_text_sprite():
+    """Rasterize the full agent response once, on the agent bubble's fill."""
+    sprite = Image.new('RGB', (AGENT_BUBBLE_WIDTH - 60, AGENT_BUBBLE_HEIGHT - 60), AGENT_BUBBLE_FILL)
+    draw = ImageDraw.Draw(sprite)
+    text_font = get_font(24)
+    for i, line in enumerate(AGENT_RESPONSE.split('\n')):
+        draw.text((0, i * AGENT_LINE_HEIGHT), line, font=text_font, fill=WHITE)
+    return sprite
+
+@lru_cache(maxsize=None)
+def get_agent_text_cuts():
+    """Map each typed prefix length to the (line, x offset) where typing continues."""
+    text_font = get_font(24)
+    cuts = []
+    for i, line in enumerate(AGENT_RESPONSE.split('\n')):
+        for j in range(len(line) + 1):
+            cuts.append((i, int(text_font.getlength(line[:j]))))
+    return cuts
+
+@lru_cache(maxsize=None)
+def get_todo_sprite():
+    """Rasterize the preview's todo list once, on the preview window's fill."""
+    sprite = Image.new('RGB', (PREVIEW_WIDTH - 60, len(TODOS) * TODO_ROW_HEIGHT), PREVIEW_FILL)
+    draw = ImageDraw.Draw(sprite)
+    todo_font = get_font(20)
+    for i, (todo, done) in enumerate(TODOS):
+        color = CYAN if done else WHITE
+        draw.text((0, i * TODO_ROW_HEIGHT), todo, font=todo_font, fill=color)
+    return sprite
+
+@lru_cache(maxsize=None)
+def get_chat_base(phase):
+    """Render the parts of the chat demo that stay the same throughout a phase.
     
-    # User bubble
-    user_bubble_left = chat_left + chat_width - 650
-    user_bubble_top = chat_top + 100
-    user_bubble_width = 600
-    user_bubble_height = 60
+    Each phase builds on the previous one, so frames only need to copy this
+    image and draw whatever is animating on top of it.
+    """
+    if phase == 0:
+        img = Image.new('RGB', (WIDTH, HEIGHT), DARKER_BG)
+    else:
+        img = get_chat_base(phase - 1).copy()
+    draw = ImageDraw.Draw(img)
     
-    if phase >= 0:
-        alpha = min(1.0, progress * 4) if phase == 0 else 1.0
-        # Simplified - just draw the bubble
+    if phase == 0:
+        # Draw chat window background
+        draw.rounded_rectangle(
+            [CHAT_LEFT, CHAT_TOP, CHAT_LEFT + CHAT_WIDTH, CHAT_TOP + CHAT_HEIGHT],
+            radius=20,
+            fill=DARK_BG,
+            outline=(50, 50, 80),
+            width=2
+        )
+        
+        # Chat header
+        draw.rectangle([CHAT_LEFT, CHAT_TOP, CHAT_LEFT + CHAT_WIDTH, CHAT_TOP + 60], fill=(40, 40, 70))
+        header_font = get_font(28, bold=True)
+        draw.text((CHAT_LEFT + 30, CHAT_TOP + 15), "OnHyper Agent Chat", font=header_font, fill=WHITE)
+        status_font = get_font(20)
+        draw.text((CHAT_LEFT + CHAT_WIDTH - 180, CHAT_TOP + 20), "● Online", font=status_font, fill=CYAN)
+        
+        # User bubble (always visible)
         draw.rounded_rectangle(
-            [user_bubble_left, user_bubble_top, user_bubble_left + user_bubble_width, user_bubble_top + user_bubble_height],
+            [USER_BUBBLE_LEFT, USER_BUBBLE_TOP, USER_BUBBLE_LEFT + USER_BUBBLE_WIDTH, USER_BUBBLE_TOP + USER_BUBBLE_HEIGHT],
             radius=15,
             fill=(60, 60, 100)
         )
-        draw.text((user_bubble_left + 20, user_bubble_top + 15), user_msg, font=user_font, fill=WHITE)
+        user_font = get_font(26)
+        draw.text((USER_BUBBLE_LEFT + 20, USER_BUBBLE_TOP + 15), USER_MSG, font=user_font, fill=WHITE)
         
         # User label
         label_font = get_font(18)
-        draw.text((user_bubble_left + 20, user_bubble_top - 22), "You", font=label_font, fill=(150, 150, 180))
+        draw.text((USER_BUBBLE_LEFT + 20, USER_BUBBLE_TOP - 22), "You", font=label_font, fill=(150, 150, 180))
     
-    # Agent response area
-    agent_bubble_left = chat_left + 50
-    agent_bubble_top = chat_top + 220
-    agent_bubble_width = 800
-    agent_bubble_height = 500
-    
-    if phase >= 1:
+    elif phase == 1:
         # Agent bubble
         draw.rounded_rectangle(
-            [agent_bubble_left, agent_bubble_top, agent_bubble_left + agent_bubble_width, agent_bubble_top + agent_bubble_height],
+            [AGENT_BUBBLE_LEFT, AGENT_BUBBLE_TOP, AGENT_BUBBLE_LEFT + AGENT_BUBBLE_WIDTH, AGENT_BUBBLE_TOP + AGENT_BUBBLE_HEIGHT],
             radius=15,
-            fill=(35, 35, 60)
+            fill=AGENT_BUBBLE_FILL
         )
         
         # Agent label
         label_font = get_font(18)
-        draw.text((agent_bubble_left + 20, agent_bubble_top - 22), "🤖 OnHyper Agent", font=label_font, fill=CYAN)
-        
-        # Agent response text with typing effect
-        agent_response = """I've created your todo app! 🎉
-
-It's now live and ready to use at:
-onhyper.io/a/your-todo-app
-
-Features included:
-✓ Add, edit, delete todos
-✓ Mark as complete
-✓ Local storage persistence
-✓ Responsive design
-
-Your app is deployed and ready!"""
-        
-        # Calculate how much text to show based on progress
-        if phase == 1:
-            chars_to_show = int(len(agent_response) * min(1.0, progress * 1.5))
-            visible_text = agent_response[:chars_to_show]
-            # Add cursor if still typing
-            if chars_to_show < len(agent_response):
-                visible_text += "▌"
-        else:
-            visible_text = agent_response
-        
-        # Draw agent text
-        text_font = get_font(24)
-        lines = visible_text.split('\n')
-        y_offset = agent_bubble_top + 30
-        for line in lines:
-            draw.text((agent_bubble_left + 30, y_offset), line, font=text_font, fill=WHITE)
-            y_offset += 36
+        draw.text((AGENT_BUBBLE_LEFT + 20, AGENT_BUBBLE_TOP - 22), "🤖 OnHyper Agent", font=label_font, fill=CYAN)
     
-    # App preview section (phase 2)
-    if phase >= 2:
-        preview_left = chat_left + chat_width - 550
-        preview_top = chat_top + 200
-        preview_width = 500
-        preview_height = 600
+    elif phase == 2:
+        # Typing has finished by now, so the full response is static
+        img.paste(get_agent_text_sprite(), AGENT_TEXT_POS)
         
         # App preview window
         draw.rounded_rectangle(
-            [preview_left, preview_top, preview_left + preview_width, preview_top + preview_height],
+            [PREVIEW_LEFT, PREVIEW_TOP, PREVIEW_LEFT + PREVIEW_WIDTH, PREVIEW_TOP + PREVIEW_HEIGHT],
             radius=15,
-            fill=(25, 25, 50),
+            fill=PREVIEW_FILL,
             outline=CYAN,
             width=2
         )
         
         # App header
-        draw.rectangle([preview_left, preview_top, preview_left + preview_width, preview_top + 50], fill=INDIGO)
+        draw.rectangle([PREVIEW_LEFT, PREVIEW_TOP, PREVIEW_LEFT + PREVIEW_WIDTH, PREVIEW_TOP + 50], fill=INDIGO)
         app_title_font = get_font(22, bold=True)
-        draw.text((preview_left + 20, preview_top + 12), "📝 Your Todo App", font=app_title_font, fill=WHITE)
+        draw.text((PREVIEW_LEFT + 20, PREVIEW_TOP + 12), "📝 Your Todo App", font=app_title_font, fill=WHITE)
+    
+    return img
+
+def get_chat_state(progress, phase):
+    """Return what a chat frame at progress (0.0 to 1.0) through phase shows.
+    
+    That is nothing for phase 0, the number of typed characters for phase 1
+    and (visible todo rows, whether the URL is shown) for phase 2. Frames
+    of the same phase with equal states are identical.
+    """
+    if phase == 1:
+        return int(len(AGENT_RESPONSE) * min(1.0, progress * 1.5))
+    if phase == 2:
+        opacity = min(1.0, progress * 2)
+        return int(len(TODOS) * opacity), progress > 0.5
+    return None
+
+@lru_cache(maxsize=None)
+def get_typing_canvas():
+    """Frame reused by every typing frame in this process; only the text area changes."""
+    return get_chat_base(1).copy()
+
+@lru_cache(maxsize=None)
+def get_typing_overlay():
+    """Text area image and its Draw, reused by every typing frame in this process."""
+    overlay = Image.new('RGB', get_agent_text_sprite().size, AGENT_BUBBLE_FILL)
+    return overlay, ImageDraw.Draw(overlay)
+
+def create_chat_demo_frame(state, phase):
+    """Create a chat demo frame showing state (see get_chat_state).
+    
+    The returned image may be shared with later frames in the same process,
+    so it must be saved before the next frame is created and never modified.
+    """
+    if phase == 0:
+        # Nothing animates while the user's message is on screen
+        return get_chat_base(0)
+    
+    if phase == 1:
+        # Agent response text with typing effect
+        chars_to_show = state
+        sprite = get_agent_text_sprite()
+        line, cut_x = get_agent_text_cuts()[chars_to_show]
+        cut_y = line * AGENT_LINE_HEIGHT
         
-        # App content - todo items
-        todo_font = get_font(20)
-        todos = [
-            ("☐ Build landing page", True),
-            ("☑ Create API endpoints", True),
-            ("☐ Add user auth", False),
-            ("☑ Deploy to production", True),
-        ]
+        # Clear the previous frame's text, then reveal the finished lines and
+        # the typed part of the current line
+        text, text_draw = get_typing_overlay()
+        text.paste(AGENT_BUBBLE_FILL, (0, 0, text.width, text.height))
+        text.paste(sprite.crop((0, 0, sprite.width, cut_y)), (0, 0))
+        text.paste(sprite.crop((0, cut_y, cut_x, cut_y + AGENT_LINE_HEIGHT)), (0, cut_y))
         
-        y_offset = preview_top + 70
-        opacity = min(1.0, progress * 2) if phase == 2 else 1.0
-        for todo, done in todos[:int(len(todos) * opacity)]:
-            color = CYAN if done else WHITE
-            draw.text((preview_left + 30, y_offset), todo, font=todo_font, fill=color)
-            y_offset += 50
+        # Add cursor if still typing
+        if chars_to_show < len(AGENT_RESPONSE):
+            text_draw.text((cut_x, cut_y), "▌", font=get_font(24), fill=WHITE)
         
-        # URL display
-        if phase == 2 and progress > 0.5:
-            url_font = get_font(18)
-            draw.text((preview_left + 30, preview_top + preview_height - 50), "🔗 onhyper.io/a/your-todo-app", font=url_font, fill=CYAN)
+        # The rest of the frame is unchanged, so only blit the text area
+        img = get_typing_canvas()
+        img.paste(text, AGENT_TEXT_POS)
+        return img
+    
+    img = get_chat_base(phase).copy()
+    draw = ImageDraw.Draw(img)
+    
+    # App content - todo items, revealed a row at a time
+    visible_rows, show_url = state
+    sprite = get_todo_sprite()
+    img.paste(sprite.crop((0, 0, sprite.width, visible_rows * TODO_ROW_HEIGHT)), TODO_POS)
+    
+    # URL display
+    if show_url:
+        url_font = get_font(18)
+        draw.text((PREVIEW_LEFT + 30, PREVIEW_TOP + PREVIEW_HEIGHT - 50), "🔗 onhyper.io/a/your-todo-app", font=url_font, fill=CYAN)
     
     return img
 
@@ -211,74 +333,198 @@ def create_outro_slide():
     # Main CTA
     cta_font = get_font(72, bold=True)
     cta = "Start Building Today"
-    bbox = draw.textbbox((0, 0), cta, font=cta_font)
-    cta_w = bbox[2] - bbox[0]
+    cta_w = get_text_width(cta, 72, bold=True)
     draw.text(((WIDTH - cta_w) // 2, HEIGHT // 2 - 150), cta, font=cta_font, fill=WHITE)
     
     # Free tier info
     free_font = get_font(36)
     free_text = "Free Tier: 100 requests/day, 3 apps"
-    bbox = draw.textbbox((0, 0), free_text, font=free_font)
-    free_w = bbox[2] - bbox[0]
+    free_w = get_text_width(free_text, 36)
     draw.text(((WIDTH - free_w) // 2, HEIGHT // 2 - 20), free_text, font=free_font, fill=CYAN)
     
     # URL
     url_font = get_font(56, bold=True)
     url = "onhyper.io"
-    bbox = draw.textbbox((0, 0), url, font=url_font)
-    url_w = bbox[2] - bbox[0]
+    url_w = get_text_width(url, 56, bold=True)
     draw.text(((WIDTH - url_w) // 2, HEIGHT // 2 + 80), url, font=url_font, fill=INDIGO)
     
     return img
 
-def main():
-    """Generate all slide images and frame sequences."""
-    output_dir = os.path.dirname(os.path.abspath(__file__))
+SLIDES = {
+    'intro': create_intro_slide,
+    'outro': create_outro_slide,
+}
+
+def frame_path(kind, idx):
+    """Path of frame idx in the 'intro', 'chat' or 'outro' sequence."""
+    return f"{OUTPUT_DIR}/{kind}/frame_{idx:04d}.png"
+
+def link_frame(src, dst):
+    """Point dst at the already-encoded frame src, copying if links aren't supported."""
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+@lru_cache(maxsize=None)
+def get_slide(kind):
+    """Render the intro or outro slide once per process."""
+    return SLIDES[kind]()
+
+@lru_cache(maxsize=None)
+def get_fade_lut(level):
+    """Build a point() lookup table fading pixels in to level out of FADE_FRAMES.
+    
+    Fading towards the background is bg + (pixel - bg) * level / FADE_FRAMES
+    per channel, so a single LUT pass over the slide replaces blending it
+    with a background image.
+    """
+    return [bg + (value - bg) * level // FADE_FRAMES for bg in DARK_BG for value in range(256)]
+
+def create_fade_frame(kind, level):
+    """Create a slide frame faded in to level out of FADE_FRAMES."""
+    if level == FADE_FRAMES:
+        return get_slide(kind)
+    return get_slide(kind).point(get_fade_lut(level))
+
+def create_frame(task):
+    """Create a single frame.
+    
+    Tasks are (kind, idx, state, phase) tuples. For chat frames, state comes
+    from get_chat_state. For the intro and outro, state is the fade level out
+    of FADE_FRAMES and phase is unused.
+    """
+    kind, idx, state, phase = task
+    if kind == 'chat':
+        return create_chat_demo_frame(state, phase)
+    return create_fade_frame(kind, state)
+
+def render_one(task):
+    """Render and save a single frame as PNG; runs in a worker process."""
+    kind, idx = task[:2]
+    path = frame_path(kind, idx)
+    # Write a new file and swap it in rather than saving over path, which may
+    # still be a hardlink shared with other frames from a previous run
+    tmp_path = f"{path}.tmp"
+    create_frame(task).save(tmp_path, format='PNG', compress_level=PNG_COMPRESS_LEVEL)
+    os.replace(tmp_path, path)
+
+def render_raw(task):
+    """Render a single frame as raw RGB bytes; runs in a worker process."""
+    return create_frame(task).tobytes()
+
+def build_sequences():
+    """Return the frame tasks of each section, in playback order.
     
-    # Create intro frame sequence (5 seconds at 30fps = 150 frames)
-    print("Creating intro frames...")
-    intro_img = create_intro_slide()
-    os.makedirs(f"{output_dir}/intro", exist_ok=True)
-    for i in range(150):
-        # Apply fade effect
-        frame = intro_img.copy()
-        if i < 30:  # Fade in
-            frame = Image.blend(Image.new('RGB', (WIDTH, HEIGHT), DARK_BG), frame, i / 30)
-        elif i > 120:  # Fade out
-            frame = Image.blend(frame, Image.new('RGB', (WIDTH, HEIGHT), DARK_BG), (i - 120) / 30)
-        frame.save(f"{output_dir}/intro/frame_{i:04d}.png")
-    print(f"  Created 150 intro frames")
+    A frame that is identical to the one before it reuses that frame's task,
+    so a task's idx is the first frame it is rendered for.
+    """
+    sequences = {}
     
-    # Create chat demo frames (12 seconds at 30fps = 360 frames)
-    print("Creating chat demo frames...")
-    os.makedirs(f"{output_dir}/chat", exist_ok=True)
+    # Intro (5 seconds at 30fps = 150 frames) and outro (6 seconds at 30fps =
+    # 180 frames) fade a static slide in and out
+    for kind, total_frames in [('intro', 150), ('outro', 180)]:
+        sequence = []
+        for i in range(total_frames):
+            level = min(i, total_frames - i, FADE_FRAMES)
+            if level == FADE_FRAMES and sequence and sequence[-1][2] == FADE_FRAMES:
+                # Fully faded-in frames are identical, so only render the first one
+                sequence.append(sequence[-1])
+            else:
+                sequence.append((kind, i, level, None))
+        sequences[kind] = sequence
     
-    total_frames = 360
+    # Chat demo frames (12 seconds at 30fps = 360 frames)
     phase_frames = [90, 180, 90]  # User message, typing response, preview
-    frame_idx = 0
+    states = [
+        (phase, get_chat_state(i / frames, phase))
+        for phase, frames in enumerate(phase_frames)
+        for i in range(frames)
+    ]
     
-    for phase, frames in enumerate(phase_frames):
-        for i in range(frames):
-            progress = i / frames
-            frame = create_chat_demo_frame(progress, phase)
-            frame.save(f"{output_dir}/chat/frame_{frame_idx:04d}.png")
-            frame_idx += 1
-    print(f"  Created {frame_idx} chat demo frames")
+    # Frames only change when a character is typed or a todo row or the URL
+    # appears, so a frame whose state matches the previous one repeats it
+    sequence = []
+    for i, (phase, state) in enumerate(states):
+        if i > 0 and states[i - 1] == (phase, state):
+            sequence.append(sequence[-1])
+        else:
+            sequence.append(('chat', i, state, phase))
+    sequences['chat'] = sequence
+    
+    return sequences
+
+def write_frames(pool, sequences):
+    """Write every section as a numbered PNG sequence."""
+    tasks = []
+    links = []  # (src, dst) pairs of identical frames, linked after rendering
+    for kind, sequence in sequences.items():
+        os.makedirs(f"{OUTPUT_DIR}/{kind}", exist_ok=True)
+        for i, task in enumerate(sequence):
+            if task[1] == i:
+                tasks.append(task)
+            else:
+                links.append((frame_path(kind, task[1]), frame_path(kind, i)))
+    
+    # Which frames are links depends on the slide and chat timing, so on a
+    # re-run a rendered frame's path may still be linked to other frames.
+    # render_one and link_frame both replace paths instead of writing
+    # through them, so old links are broken rather than overwritten.
+    print(f"Rendering {len(tasks)} frames on {cpu_count()} processes...")
+    pool.map(render_one, tasks, chunksize=16)
+    for src, dst in links:
+        link_frame(src, dst)
+
+def write_video(pool, kind, sequence):
+    """Pipe a section's frames straight into ffmpeg, skipping intermediate PNGs."""
+    output_path = f"{OUTPUT_DIR}/{kind}.mp4"
+    cmd = [
+        'ffmpeg', '-y', '-loglevel', 'error',
+        '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{WIDTH}x{HEIGHT}', '-r', str(FPS),
+        '-i', '-',
+        '-c:v', 'libx264', '-pix_fmt', 'yuv420p',
+        output_path,
+    ]
+    print(f"Encoding {output_path}...")
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+    try:
+        # Only the first of a run of identical frames is rendered; imap keeps
+        # the results in playback order
+        rendered = pool.imap(render_raw, [t for i, t in enumerate(sequence) if t[1] == i], chunksize=4)
+        for i, task in enumerate(sequence):
+            if task[1] == i:
+                frame = next(rendered)
+            proc.stdin.write(frame)
+    finally:
+        proc.stdin.close()
+    if proc.wait() != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+def main():
+    """Generate all slide images and frame sequences."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--video',
+        action='store_true',
+        help='pipe frames into ffmpeg and write intro.mp4, chat.mp4 and outro.mp4 instead of PNG frames',
+    )
+    args = parser.parse_args()
+    
+    sequences = build_sequences()
     
-    # Create outro frame sequence (6 seconds at 30fps = 180 frames)
-    print("Creating outro frames...")
-    outro_img = create_outro_slide()
-    os.makedirs(f"{output_dir}/outro", exist_ok=True)
-    for i in range(180):
-        frame = outro_img.copy()
-        if i < 30:  # Fade in
-            frame = Image.blend(Image.new('RGB', (WIDTH, HEIGHT), DARK_BG), frame, i / 30)
-        elif i > 150:  # Fade out
-            frame = Image.blend(frame, Image.new('RGB', (WIDTH, HEIGHT), DARK_BG), (i - 150) / 30)
-        frame.save(f"{output_dir}/outro/frame_{i:04d}.png")
-    print(f"  Created 180 outro frames")
+    # Frames don't depend on each other, so render them on every core
+    with Pool() as pool:
+        if args.video:
+            for kind, sequence in sequences.items():
+                write_video(pool, kind, sequence)
+        else:
+            write_frames(pool, sequences)
+    counts = {kind: len(sequence) for kind, sequence in sequences.items()}
+    print(f"  Created {counts['intro']} intro, {counts['chat']} chat demo and {counts['outro']} outro frames")
     
     print("All frames generated successfully!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()